@@ -3,7 +3,7 @@ __version__ = "1.0.2"
 __author__ = "Mr Noor"
 __description__ = "Watch your income grow in real-time"
 
-from .core import IncomeConfig, IncomeTracker
+from .core import IncomeConfig, IncomeTracker, to_micros, from_micros
 from .display import MyiDisplay
 
-__all__ = ["IncomeConfig", "IncomeTracker", "MyiDisplay"]
+__all__ = ["IncomeConfig", "IncomeTracker", "MyiDisplay", "to_micros", "from_micros"]
@@ -1,37 +1,58 @@
 import click
+import functools
 import json
-from decimal import Decimal
+from dataclasses import replace
 from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 
-from .core import IncomeConfig
+from .core import IncomeConfig, from_micros, to_micros
 from .display import MyiDisplay
 
+try:
+    import orjson
+    
+    _loads = orjson.loads
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
 console = Console()
 CONFIG_PATH = Path.home() / ".myi" / "config.json"
 
 
+@functools.lru_cache(maxsize=8)
+def _read_config(path: str, mtime_ns: int) -> dict:
+    # mtime_ns is only part of the cache key, so edits to the file are picked up
+    return _loads(Path(path).read_bytes())
+
+
 def load_config() -> dict:
-    if CONFIG_PATH.exists():
-        with open(CONFIG_PATH) as f:
-            return json.load(f)
-    return {}
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return dict(_read_config(str(CONFIG_PATH), mtime_ns))
 
 
 def save_config(config: dict):
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(CONFIG_PATH, "w") as f:
-        json.dump(config, f, indent=2)
+    CONFIG_PATH.write_bytes(_dumps(config))
 
 
 def get_default_config() -> IncomeConfig:
+    # Amounts are saved as strings; to_micros also accepts older numeric configs
     saved = load_config()
     return IncomeConfig(
-        annual_salary=Decimal(str(saved.get("salary", 50000))),
+        annual_salary=to_micros(saved.get("salary", 50000)),
         currency=saved.get("currency", "$"),
-        side_income=Decimal(str(saved.get("side", 0))),
-        passive_income=Decimal(str(saved.get("passive", 0)))
+        side_income=to_micros(saved.get("side", 0)),
+        passive_income=to_micros(saved.get("passive", 0))
     )
 
 
@@ -55,21 +76,24 @@ def cli(ctx, salary, currency, side, passive, once):
     if ctx.invoked_subcommand is None:
         config = get_default_config()
         
+        overrides = {}
         if salary is not None:
-            config.annual_salary = Decimal(str(salary))
+            overrides["annual_salary"] = to_micros(salary)
         if currency != "$":
-            config.currency = currency
+            overrides["currency"] = currency
         if side != 0:
-            config.side_income = Decimal(str(side))
+            overrides["side_income"] = to_micros(side)
         if passive != 0:
-            config.passive_income = Decimal(str(passive))
+            overrides["passive_income"] = to_micros(passive)
+        if overrides:
+            config = replace(config, **overrides)
         
         if any([salary is not None, currency != "$", side != 0, passive != 0]):
             save_config({
-                "salary": float(config.annual_salary),
+                "salary": str(from_micros(config.annual_salary)),
                 "currency": config.currency,
-                "side": float(config.side_income),
-                "passive": float(config.passive_income)
+                "side": str(from_micros(config.side_income)),
+                "passive": str(from_micros(config.passive_income))
             })
         
         display = MyiDisplay(config)
@@ -84,14 +108,14 @@ def cli(ctx, salary, currency, side, passive, once):
 @click.option("--salary", prompt="Annual Salary", type=float)
 @click.option("--currency", prompt="Currency Symbol", default="$")
 @click.option("--side", prompt="Side Income (annual)", default=0.0)
-@click.option("--passive", prompt("Passive Income (annual)", default=0.0)
+@click.option("--passive", prompt="Passive Income (annual)", default=0.0)
 def config(salary, currency, side, passive):
     """Interactive configuration setup"""
     config_data = {
-        "salary": salary,
+        "salary": str(from_micros(to_micros(salary))),
         "currency": currency,
-        "side": side,
-        "passive": passive
+        "side": str(from_micros(to_micros(side))),
+        "passive": str(from_micros(to_micros(passive)))
     }
     save_config(config_data)
     
@@ -111,9 +135,9 @@ def config(salary, currency, side, passive):
 def demo():
     """Run with demo data"""
     config = IncomeConfig(
-        annual_salary=Decimal("180000"),
-        side_income=Decimal("25000"),
-        passive_income=Decimal("5000"),
+        annual_salary=to_micros(180000),
+        side_income=to_micros(25000),
+        passive_income=to_micros(5000),
         currency="$"
     )
     display = MyiDisplay(config)
@@ -1,78 +1,90 @@
 import time
-import threading
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal
 from dataclasses import dataclass
-from typing import Optional, Callable, List
+from functools import cached_property
+from typing import Union
 
+# Money is stored as integer ten-thousandths of a currency unit ("micros")
+MICROS_PER_UNIT = 10_000
 
-@dataclass
+
+def to_micros(amount: Union[Decimal, float, int, str]) -> int:
+    """Convert a user-facing amount to integer ten-thousandths"""
+    return int(round(Decimal(str(amount)) * MICROS_PER_UNIT))
+
+
+def from_micros(micros: int) -> Decimal:
+    """Convert integer ten-thousandths back to an exact Decimal amount"""
+    return Decimal(micros).scaleb(-4)
+
+
+@dataclass(frozen=True)
 class IncomeConfig:
-    """Configuration for income calculations"""
-    annual_salary: Decimal
+    """Configuration for income calculations, with amounts in micros"""
+    annual_salary: int
     currency: str = "$"
-    work_hours_per_day: Decimal = Decimal("8")
-    work_days_per_year: Decimal = Decimal("250")
-    side_income: Decimal = Decimal("0")
-    passive_income: Decimal = Decimal("0")
+    work_hours_per_day: int = 8
+    work_days_per_year: int = 250
+    side_income: int = 0
+    passive_income: int = 0
     
-    @property
-    def total_annual(self) -> Decimal:
+    @cached_property
+    def total_annual(self) -> int:
         return self.annual_salary + self.side_income + self.passive_income
     
-    @property
-    def per_second(self) -> Decimal:
-        total_seconds = self.work_hours_per_day * Decimal("3600") * self.work_days_per_year
-        if total_seconds == 0:
-            return Decimal("0")
-        return (self.total_annual / total_seconds).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+    @cached_property
+    def total_seconds(self) -> int:
+        return self.work_hours_per_day * 3600 * self.work_days_per_year
+    
+    @cached_property
+    def total_ns(self) -> int:
+        return self.total_seconds * 1_000_000_000
+    
+    def earned_over(self, seconds: int) -> int:
+        """Earnings for `seconds` of work, rounded half up to the nearest micro"""
+        if self.total_seconds == 0:
+            return 0
+        return (2 * self.total_annual * seconds + self.total_seconds) // (2 * self.total_seconds)
+    
+    @cached_property
+    def per_second(self) -> int:
+        return self.earned_over(1)
+    
+    @cached_property
+    def per_minute(self) -> int:
+        return self.earned_over(60)
+    
+    @cached_property
+    def per_hour(self) -> int:
+        return self.earned_over(3600)
+    
+    @cached_property
+    def per_day(self) -> int:
+        return self.earned_over(3600 * self.work_hours_per_day)
 
 
 class IncomeTracker:
-    """Real-time income tracker with threading support"""
+    """Real-time income tracker, sampled on demand by the display"""
     
     def __init__(self, config: IncomeConfig):
         self.config = config
-        self.accumulated = Decimal("0")
-        self.start_time = time.time()
-        self._running = False
-        self._thread: Optional[threading.Thread] = None
-        self._callbacks: List[Callable] = []
-        self._lock = threading.Lock()
-    
-    def start(self):
-        self._running = True
-        self.start_time = time.time()
-        self._thread = threading.Thread(target=self._track_loop, daemon=True)
-        self._thread.start()
+        self.start_ns = time.monotonic_ns()
     
-    def stop(self):
-        self._running = False
-        if self._thread:
-            self._thread.join(timeout=1.0)
-    
-    def _track_loop(self):
-        while self._running:
-            elapsed = time.time() - self.start_time
-            with self._lock:
-                self.accumulated = Decimal(str(elapsed)) * self.config.per_second
-            for callback in self._callbacks:
-                try:
-                    callback(self.accumulated, elapsed)
-                except Exception:
-                    pass
-            time.sleep(0.1)
-    
-    def get_current(self) -> tuple[Decimal, float]:
-        with self._lock:
-            elapsed = time.time() - self.start_time
-            current = Decimal(str(elapsed)) * self.config.per_second
-            return current, elapsed
+    @property
+    def accumulated(self) -> int:
+        return self.get_current()[0]
     
-    def on_update(self, callback: Callable):
-        self._callbacks.append(callback)
+    def get_current(self) -> tuple[int, float]:
+        """Return (accumulated ten-thousandths, elapsed seconds)"""
+        # Only reads the immutable config and start_ns, so it is safe to call
+        # from Live's refresh thread and the main thread at the same time.
+        elapsed_ns = time.monotonic_ns() - self.start_ns
+        # Scale by the exact annual/working-time ratio so the only rounding
+        # is the final truncation to whole micros. A zero rate never
+        # accumulates, so skip the multiply entirely.
+        if not (self.config.total_annual and self.config.total_ns):
+            return 0, elapsed_ns / 1e9
+        return (elapsed_ns * self.config.total_annual) // self.config.total_ns, elapsed_ns / 1e9
     
     def reset(self):
-        with self._lock:
-            self.start_time = time.time()
-            self.accumulated = Decimal("0")
-
+        self.start_ns = time.monotonic_ns()
@@ -1,6 +1,8 @@
-import time
-from decimal import Decimal
+import signal
+import threading
+from functools import lru_cache
 from typing import Optional
+from rich.cells import cell_len
 from rich.console import Console, Group
 from rich.panel import Panel
 from rich.text import Text
@@ -8,9 +10,114 @@ from rich.layout import Layout
 from rich.live import Live
 from rich.table import Table
 from rich.align import Align
+from rich.segment import Segment, SegmentLines
+from rich.style import Style
 from rich import box
 
-from .core import IncomeConfig, IncomeTracker
+from .core import MICROS_PER_UNIT, IncomeConfig, IncomeTracker
+
+# Pre-parsed styles and fixed labels, shared by every frame
+_STYLE_COUNTER = Style(bold=True, color="bright_green")
+_STYLE_HEADING = Style(bold=True, underline=True, color="bright_cyan")
+_STYLE_LABEL = Style(dim=True, color="cyan")
+_STYLE_SOURCE = Style(color="cyan")
+_STYLE_VALUE = Style(color="bright_white")
+_STYLE_DIM = Style(dim=True)
+_STYLE_STATS_BORDER = Style(color="bright_green")
+
+_STATS_TITLE = Text("Real-Time Earnings", style=Style(color="bright_yellow"))
+_ACCUMULATED_HEADING = Align.center(Text("ACCUMULATED", style=_STYLE_HEADING))
+_SPACER = Text("")
+
+# Stand-ins for the two dynamic cells while rendering the stats template
+_COUNTER_MARK = "\ue000"
+_SESSION_MARK = "\ue001"
+
+_LABEL_SESSION = "⏱️  Session"
+_LABEL_PER_SECOND = "⚡ Per Second"
+_LABEL_PER_MINUTE = "📊 Per Minute"
+_LABEL_PER_HOUR = "🕐 Per Hour"
+_LABEL_WORK_DAY = "📅 Work Day"
+_LABEL_SALARY = "💼 Salary"
+_LABEL_SIDE = "🚀 Side Income"
+_LABEL_PASSIVE = "📈 Passive"
+
+
+def _format_units(micros: int) -> str:
+    # divmod floors, so split the magnitude and add the sign back
+    sign = "-" if micros < 0 else ""
+    whole, frac = divmod(abs(micros), MICROS_PER_UNIT)
+    return f"{sign}{whole:,}.{frac:04d}"
+
+
+@lru_cache(maxsize=16)
+def _format_money(currency: str, micros: int) -> str:
+    # Cached for the handful of fixed rate amounts; the live counter changes
+    # every frame and formats through _format_units directly.
+    return f"{currency}{_format_units(micros)}"
+
+
+class _LiveStats:
+    """Stats panel that samples the tracker whenever Live renders it
+    
+    The panel is rendered once per size into segment lines with placeholder
+    cells; each frame only swaps the counter and session text into a copy of
+    those lines instead of laying out the table and panel again.
+    """
+    
+    def __init__(self, display: "MyiDisplay", tracker: IncomeTracker):
+        self._display = display
+        self._tracker = tracker
+        self._template_key: Optional[tuple[int, Optional[int], int, int]] = None
+        self._template = None
+    
+    def _find(self, lines, mark: str):
+        # Table cells share a segment with their column padding, so the mark
+        # is located within the segment text
+        for y, line in enumerate(lines):
+            for x, segment in enumerate(line):
+                if mark in segment.text:
+                    return y, x, segment.text.split(mark, 1), segment.style
+        return None
+    
+    def _build_template(self, console, options, counter_width: int, session_width: int):
+        display = self._display
+        counter_mark = _COUNTER_MARK * counter_width
+        session_mark = _SESSION_MARK * session_width
+        display._counter_text.plain = counter_mark
+        display._session_text.plain = session_mark
+        lines = console.render_lines(display._stats_panel, options)
+        counter_slot = self._find(lines, counter_mark)
+        session_slot = self._find(lines, session_mark)
+        if counter_slot is None or session_slot is None or counter_slot[0] == session_slot[0]:
+            # Cells were wrapped or cropped at this size
+            return None
+        return lines, counter_slot, session_slot
+    
+    def __rich_console__(self, console, options):
+        accumulated, elapsed = self._tracker.get_current()
+        counter, session = self._display._format_stats(accumulated, elapsed)
+        
+        # A new size or a wider value shifts the layout, so re-render then
+        key = (options.max_width, options.height, cell_len(counter), cell_len(session))
+        if key != self._template_key:
+            self._template_key = key
+            self._template = self._build_template(console, options, key[2], key[3])
+        
+        if self._template is None:
+            # Render at the full region size, as a Panel placed straight in
+            # the layout would; yielding it would drop the region height.
+            panel = self._display._update_stats_panel(accumulated, elapsed)
+            yield SegmentLines(console.render_lines(panel, options), new_lines=True)
+            return
+        
+        lines, counter_slot, session_slot = self._template
+        frame = list(lines)
+        for (y, x, (before, after), style), text in ((counter_slot, counter), (session_slot, session)):
+            line = list(frame[y])
+            line[x] = Segment(before + text + after, style)
+            frame[y] = line
+        yield SegmentLines(frame, new_lines=True)
 
 
 class MyiDisplay:
@@ -21,9 +128,30 @@ class MyiDisplay:
         self.console = Console()
         self.tracker: Optional[IncomeTracker] = None
         self.live: Optional[Live] = None
+        self._quit = threading.Event()
+        
+        # The rate rows never change during a session, so format them once
+        self._per_sec_str = _format_money(config.currency, config.per_second)
+        self._per_min_str = _format_money(config.currency, config.per_minute)
+        self._per_hour_str = _format_money(config.currency, config.per_hour)
+        self._per_day_str = _format_money(config.currency, config.per_day)
+        self._rate_rows = (
+            (_LABEL_PER_SECOND, self._per_sec_str, "base rate"),
+            (_LABEL_PER_MINUTE, self._per_min_str, f"+{self._per_min_str}"),
+            (_LABEL_PER_HOUR, self._per_hour_str, f"+{self._per_hour_str}"),
+            (_LABEL_WORK_DAY, self._per_day_str, f"+{self._per_day_str}"),
+        )
+        
+        # All panels are built once; per frame only the stats panel's counter
+        # and session cells are updated.
+        self._header_panel = self._create_header()
+        self._stats_panel = self._create_stats_panel()
+        self._breakdown_panel = self._create_breakdown_panel()
+        self._footer = Align.center(self._create_footer())
+        self._layout = self._create_layout()
     
-    def _format_money(self, amount: Decimal) -> str:
-        return f"{self.config.currency}{amount:,.4f}"
+    def _format_whole(self, micros: int) -> str:
+        return f"{self.config.currency}{(micros + MICROS_PER_UNIT // 2) // MICROS_PER_UNIT:,}"
     
     def _create_header(self) -> Panel:
         title = Text("💰 MYI ", style="bold bright_yellow")
@@ -37,64 +165,66 @@ class MyiDisplay:
             padding=(1, 2)
         )
     
-    def _create_stats_panel(self, accumulated: Decimal, elapsed: float) -> Panel:
-        per_sec = self.config.per_second
-        per_min = per_sec * 60
-        per_hour = per_sec * 3600
-        per_day = per_hour * 8
-        
-        main_counter = Text(self._format_money(accumulated), style="bold bright_green")
+    def _create_stats_panel(self) -> Panel:
+        # Built once; the counter and session cells are Text objects that
+        # _update_stats_panel rewrites in place.
+        self._counter_text = Text(_format_money(self.config.currency, 0), style=_STYLE_COUNTER)
+        self._session_text = Text("0.0s")
         
         table = Table(show_header=False, box=None, padding=(0, 2))
-        table.add_column("Label", style="dim cyan", justify="right")
-        table.add_column("Value", style="bright_white")
-        table.add_column("Rate", style="dim", justify="right")
+        table.add_column("Label", style=_STYLE_LABEL, justify="right")
+        table.add_column("Value", style=_STYLE_VALUE)
+        table.add_column("Rate", style=_STYLE_DIM, justify="right")
         
-        table.add_row("⏱️  Session", f"{elapsed:.1f}s", "")
-        table.add_row("⚡ Per Second", self._format_money(per_sec), "base rate")
-        table.add_row("📊 Per Minute", self._format_money(per_min), f"+{self._format_money(per_min)}")
-        table.add_row("🕐 Per Hour", self._format_money(per_hour), f"+{self._format_money(per_hour)}")
-        table.add_row("📅 Work Day", self._format_money(per_day), f"+{self._format_money(per_day)}")
+        table.add_row(_LABEL_SESSION, self._session_text, "")
+        for row in self._rate_rows:
+            table.add_row(*row)
         
         content = Group(
-            Align.center(Text("ACCUMULATED", style="bold underline bright_cyan")),
-            Align.center(main_counter),
-            Text(""),
+            _ACCUMULATED_HEADING,
+            Align.center(self._counter_text),
+            _SPACER,
             table
         )
         
         return Panel(
             content,
-            title="[bright_yellow]Real-Time Earnings[/]",
-            border_style="bright_green",
+            title=_STATS_TITLE,
+            border_style=_STYLE_STATS_BORDER,
             box=box.ROUNDED
         )
     
+    def _format_stats(self, accumulated: int, elapsed: float) -> tuple[str, str]:
+        return f"{self.config.currency}{_format_units(accumulated)}", f"{elapsed:.1f}s"
+    
+    def _update_stats_panel(self, accumulated: int, elapsed: float) -> Panel:
+        self._counter_text.plain, self._session_text.plain = self._format_stats(accumulated, elapsed)
+        return self._stats_panel
+    
     def _create_breakdown_panel(self) -> Panel:
         table = Table(box=None, show_header=False)
-        table.add_column("Source", style="cyan")
-        table.add_column("Annual", style="bright_white", justify="right")
-        table.add_column("Per Sec", style="dim", justify="right")
+        table.add_column("Source", style=_STYLE_SOURCE)
+        table.add_column("Annual", style=_STYLE_VALUE, justify="right")
+        table.add_column("Per Sec", style=_STYLE_DIM, justify="right")
         
         total_sec = self.config.per_second
+        total = self.config.total_annual
+        sources = (
+            (_LABEL_SALARY, self.config.annual_salary),
+            (_LABEL_SIDE, self.config.side_income),
+            (_LABEL_PASSIVE, self.config.passive_income),
+        )
         
-        if self.config.annual_salary > 0:
-            pct = (self.config.annual_salary / self.config.total_annual * 100) if self.config.total_annual > 0 else 0
-            table.add_row("💼 Salary", f"{self.config.currency}{self.config.annual_salary:,.0f}", f"{pct:.1f}%")
-        
-        if self.config.side_income > 0:
-            pct = (self.config.side_income / self.config.total_annual * 100) if self.config.total_annual > 0 else 0
-            table.add_row("🚀 Side Income", f"{self.config.currency}{self.config.side_income:,.0f}", f"{pct:.1f}%")
-            
-        if self.config.passive_income > 0:
-            pct = (self.config.passive_income / self.config.total_annual * 100) if self.config.total_annual > 0 else 0
-            table.add_row("📈 Passive", f"{self.config.currency}{self.config.passive_income:,.0f}", f"{pct:.1f}%")
+        for label, amount in sources:
+            if amount > 0:
+                pct = (amount / total * 100) if total > 0 else 0
+                table.add_row(label, self._format_whole(amount), f"{pct:.1f}%")
         
         table.add_row("", "", "")
         table.add_row(
             "[bold]TOTAL[/bold]",
-            f"[bold bright_green]{self.config.currency}{self.config.total_annual:,.0f}[/]",
-            f"[bold]{total_sec:.4f}/s[/]"
+            f"[bold bright_green]{self._format_whole(total)}[/]",
+            f"[bold]{_format_units(total_sec)}/s[/]"
         )
         
         return Panel(
@@ -111,7 +241,7 @@ class MyiDisplay:
         controls.append(" Quit  ", style="dim")
         return controls
     
-    def generate_layout(self, accumulated: Decimal = Decimal("0"), elapsed: float = 0) -> Layout:
+    def _create_layout(self) -> Layout:
         layout = Layout()
         layout.split_column(
             Layout(name="header", size=5),
@@ -122,32 +252,46 @@ class MyiDisplay:
             Layout(name="stats", ratio=2),
             Layout(name="breakdown", ratio=1)
         )
-        layout["header"].update(self._create_header())
-        layout["stats"].update(self._create_stats_panel(accumulated, elapsed))
-        layout["breakdown"].update(self._create_breakdown_panel())
-        layout["footer"].update(Align.center(self._create_footer()))
+        layout["header"].update(self._header_panel)
+        layout["stats"].update(self._stats_panel)
+        layout["breakdown"].update(self._breakdown_panel)
+        layout["footer"].update(self._footer)
         return layout
     
+    def generate_layout(self, accumulated: int = 0, elapsed: float = 0) -> Layout:
+        self._layout["stats"].update(self._update_stats_panel(accumulated, elapsed))
+        return self._layout
+    
     def run_live(self):
         self.tracker = IncomeTracker(self.config)
         
-        with Live(self.generate_layout(), refresh_per_second=10, screen=True) as live:
-            self.live = live
-            
-            def update_display(acc, elapsed):
-                live.update(self.generate_layout(acc, elapsed))
-            
-            self.tracker.on_update(update_display)
-            self.tracker.start()
-            
-            try:
-                while True:
-                    time.sleep(0.1)
-            except KeyboardInterrupt:
-                pass
-            finally:
-                self.tracker.stop()
-                self._show_summary()
+        # Live's own 10 Hz refresh drives the updates; the stats slot reads
+        # the tracker each time it is rendered.
+        self._layout["stats"].update(_LiveStats(self, self.tracker))
+        
+        self._quit.clear()
+        
+        # Ctrl+C just releases the wait below so shutdown runs normally.
+        # Signal handlers can only be installed from the main thread.
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGINT, lambda signum, frame: self._quit.set())
+        
+        try:
+            with Live(self._layout, refresh_per_second=10, screen=True) as live:
+                self.live = live
+                
+                try:
+                    # A timed wait, since an untimed one ignores Ctrl+C on Windows
+                    while not self._quit.wait(1.0):
+                        pass
+                except KeyboardInterrupt:
+                    pass
+                finally:
+                    self._show_summary()
+        finally:
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
     
     def _show_summary(self):
         if self.tracker:
@@ -155,13 +299,13 @@ class MyiDisplay:
             self.console.print()
             self.console.print(Panel(
                 f"[bold green]Session Complete![/]\n\n"
-                f"You earned [bold bright_green]{self._format_money(final)}[/] "
+                f"You earned [bold bright_green]{_format_money(self.config.currency, final)}[/] "
                 f"in [cyan]{elapsed:.1f}[/] seconds\n"
-                f"That's [bold]{self._format_money(final / Decimal(str(elapsed)) * 3600)}[/] per hour!",
+                f"That's [bold]{_format_money(self.config.currency, int(final / elapsed * 3600))}[/] per hour!",
                 title="[bright_yellow]Summary[/]",
                 border_style="green"
             ))
     
     def run_once(self):
-        layout = self.generate_layout()
-        self.console.print(layout)
+        self.generate_layout()
+        self.console.print(self._layout)